@@ -23,6 +23,7 @@
 
 import os.path
 import argparse
+import concurrent.futures
 import subprocess
 import json
 
@@ -81,7 +82,10 @@ def get_loc_summary(path):
 
 
 def print_loc_summaries(paths):
-  summaries = [get_loc_summary(path) for path in paths]
+  # Each path is a separate `tokei` run, so overlap them rather than
+  # waiting on each subprocess in turn.
+  with concurrent.futures.ThreadPoolExecutor() as executor:
+    summaries = list(executor.map(get_loc_summary, paths))
   headers = ['Path', 'Shared', 'Android', 'iOS', 'Total', 'Shared %']
   nameWidth = max(
     len(headers[0]),